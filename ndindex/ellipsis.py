@@ -38,6 +38,8 @@ class ellipsis(NDIndex):
     it.
 
     """
+    __slots__ = ()
+
     def _typecheck(self):
         return ()
 
@@ -1,4 +1,4 @@
-import operator
+from operator import index as operator_index
 
 from .ndindex import NDIndex
 
@@ -21,11 +21,30 @@ class Integer(NDIndex):
     consistency, as this only works for `Integer`.
 
     """
+    __slots__ = ()
+
+    def __new__(cls, idx):
+        # Integer is immutable, so Integer(i) can return i itself when i is
+        # already an Integer.
+        if type(idx) is cls:
+            return idx
+
+        # This is the same as NDIndex.__new__, inlined to avoid an extra
+        # call on this hot path.
+        obj = object.__new__(cls)
+        obj.args = obj._typecheck(idx)
+        obj._hash = None
+        return obj
+
     def _typecheck(self, idx):
-        idx = operator.index(idx)
+        idx = operator_index(idx)
 
         return (idx,)
 
+    def __repr__(self):
+        # Specialized version of NDIndex.__repr__ for the single argument
+        return f"{self.__class__.__name__}({self.args[0]})"
+
     def __index__(self):
         return self.raw
 
@@ -12,23 +12,24 @@ def ndindex(obj):
     >>> ndindex(slice(0, 10))
     Slice(0, 10, None)
     """
-    from . import Integer, Slice, Tuple, ellipsis
-
     if isinstance(obj, NDIndex):
         return obj
 
+    # Check for slices and tuples before trying Integer, so that the common
+    # cases don't pay for raising and catching a TypeError from
+    # operator.index().
+    if isinstance(obj, slice):
+        return Slice.from_raw(obj)
+
+    if isinstance(obj, tuple):
+        return Tuple(*obj)
+
     try:
         # If operator.index() works, use that
         return Integer(obj)
     except TypeError:
         pass
 
-    if isinstance(obj, slice):
-        return Slice(obj)
-
-    if isinstance(obj, tuple):
-        return Tuple(*obj)
-
     if obj == ellipsis:
         raise TypeError("Got ellipsis class. Did you mean to use the instance, ellipsis()?")
     if obj is Ellipsis:
@@ -81,19 +82,36 @@ class NDIndex:
       canonical form that is equivalent for all array shapes (assuming no
       IndexErrors).
 
-    The methods `__init__`, `__eq__`, and `__hash__` should *not* be
-    overridden. Equality (and hashability) on `NDIndex` subclasses is
-    determined by equality of types and `.args`. Equivalent indices should not
-    attempt to redefine equality. Rather they should define canonicalization
-    via `reduce()`.
+    The methods `__eq__` and `__hash__` should *not* be overridden. Equality
+    (and hashability) on `NDIndex` subclasses is determined by equality of
+    types and `.args`. Equivalent indices should not attempt to redefine
+    equality. Rather they should define canonicalization via `reduce()`.
+
+    ndindex objects are constructed in `__new__`. Subclasses should not
+    define `__init__`. They may override `__new__` to add a fast path (for
+    instance, returning an existing instance unchanged). A subclass `__new__`
+    that creates the instance itself rather than calling `NDIndex.__new__`
+    must initialize it the same way `NDIndex.__new__` does.
+
+    Subclasses should also define `__slots__` (usually `__slots__ = ()`), so
+    that instances do not carry a `__dict__`. ndindex objects are small and
+    are created often, so this keeps them lightweight.
 
     """
-    def __init__(self, *args):
-        """
-        This method should be called by subclasses (via super()) after type-checking
-        """
-        args = self._typecheck(*args)
-        self.args = args
+    __slots__ = ('args', '_hash')
+
+    def __new__(cls, *args):
+        obj = object.__new__(cls)
+        obj.args = obj._typecheck(*args)
+        obj._hash = None
+        return obj
+
+    def __reduce__(self):
+        # Pickle and copy recreate the object from its args only. The cached
+        # values in the private slots (like _hash) must not be carried over:
+        # hash(None) is not stable across processes before Python 3.12, and
+        # the constructor may return an existing, shared instance.
+        return (type(self), self.args)
 
     @classproperty
     def __signature__(self):
@@ -110,18 +128,35 @@ class NDIndex:
         return f"{self.__class__.__name__}({', '.join(map(str, self.args))})"
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if not isinstance(other, NDIndex):
             try:
                 other = ndindex(other)
             except (TypeError, NotImplementedError):
                 return False
 
+        # If both hashes have already been computed, unequal hashes mean
+        # unequal args, without having to compare them. This relies on _hash
+        # only ever being set by __hash__ itself (in particular, __reduce__
+        # ensures that pickle and copy never restore it).
+        if (self._hash is not None and other._hash is not None
+            and self._hash != other._hash):
+            return False
+
         return ((isinstance(other, self.__class__)
                  or isinstance(self, other.__class__))
                 and self.args == other.args)
 
     def __hash__(self):
-        return hash(self.args)
+        # ndindex objects are immutable, so the hash can be computed once.
+        # This matters most for Tuple, whose args are themselves ndindex
+        # objects.
+        h = self._hash
+        if h is None:
+            h = self._hash = hash(self.args)
+        return h
 
     # TODO: Make NDIndex an abstract base class
     @property
@@ -303,3 +338,11 @@ class NDIndex:
         """
         index = ndindex(index) # pragma: no cover
         raise NotImplementedError(f"{type(self).__name__}.as_subindex({type(index).__name__}) isn't implemented yet")
+
+# These are imported here rather than at the top of the module because they
+# import NDIndex from this module. They are not imported inside ndindex()
+# itself since it is called for every argument of every Tuple.
+from .integer import Integer
+from .slice import Slice
+from .tuple import Tuple
+from .ellipsis import ellipsis
@@ -1,4 +1,5 @@
-import operator
+from operator import index as operator_index
+from collections import OrderedDict
 import math
 
 from sympy.ntheory.modular import crt
@@ -16,6 +17,51 @@ class default:
     """
     pass
 
+# Slice objects created from small int (or None) arguments are interned here,
+# so that repeatedly constructing the same slice returns the same object
+# (along with its cached raw and hash). Only int values with
+# -_SLICE_CACHE_BOUND <= value < _SLICE_CACHE_BOUND are interned, and the
+# cache is an LRU cache holding the _SLICE_CACHE_SIZE most recently used
+# slices. Together these bound its memory use. Slice.from_raw(), and hence
+# ndindex(), also use this cache.
+_slice_cache = OrderedDict()
+_SLICE_CACHE_SIZE = 1024
+_SLICE_CACHE_BOUND = 2**16
+
+def _reduce_no_shape(start, stop, step):
+    """
+    Canonicalize the arguments of a slice with no shape
+
+    This is the arithmetic for `Slice.reduce()` with no shape. It is factored
+    out so that `Slice.__len__` can use it without creating an intermediate
+    Slice object.
+    """
+    if step is None:
+        step = 1
+    if start is None and step > 0:
+        start = 0
+
+    if start is not None and stop is not None:
+        # A slice acts like range(start, stop, step) only if 0 <= start
+        # <= stop (or visa-versa for negative step). Otherwise, slices
+        # are different because of wrap-around behavior. For example,
+        # range(-3, 1) represents [-3, -2, -1, 0] whereas slice(-3, 1)
+        # represents the slice of elements from the third to last to the
+        # first, which is either an empty slice or a single element slice
+        # depending on the shape of the axis.
+        #
+        # When start and stop are nonnegative, the slice is empty exactly
+        # when the corresponding range is. This is checked directly,
+        # rather than with len(range(start, stop, step)) == 0, to avoid
+        # creating a range object.
+        if start >= 0 and stop >= 0 and (start >= stop if step > 0 else start <= stop):
+            start, stop, step = 0, 0, 1
+        # Canonicalizing a single element slice to Integer is not correct
+        # because a slice keeps the axis whereas an integer index removes
+        # it.
+
+    return start, stop, step
+
 class Slice(NDIndex):
     """
     Represents a slice on an axis of an nd-array.
@@ -54,8 +100,78 @@ class Slice(NDIndex):
     slice(None, 10, None)
 
     """
+    __slots__ = ('_raw', '_len')
+
+    def __new__(cls, start, stop=default, step=None):
+        # Slice is immutable, so Slice(s) can return s itself when s is
+        # already a Slice.
+        if type(start) is cls and stop is default and step is None:
+            return start
+
+        # Only arguments of type int are used as keys, since other types may
+        # compare equal to an int without being valid (e.g., 1.0 == 1).
+        key = None
+        if ((start is None or type(start) is int
+             and -_SLICE_CACHE_BOUND <= start < _SLICE_CACHE_BOUND)
+            and (stop is default or stop is None or type(stop) is int
+                 and -_SLICE_CACHE_BOUND <= stop < _SLICE_CACHE_BOUND)
+            and (step is None or type(step) is int
+                 and -_SLICE_CACHE_BOUND <= step < _SLICE_CACHE_BOUND)):
+            key = (cls, start, stop, step)
+            obj = _slice_cache.get(key)
+            if obj is not None:
+                _slice_cache.move_to_end(key)
+                return obj
+
+        # This is the same as NDIndex.__new__, inlined to avoid an extra
+        # call on this hot path.
+        obj = object.__new__(cls)
+        obj.args = args = obj._typecheck(start, stop, step)
+        obj._hash = None
+        # Slice is immutable, so the slice object for raw is only created once
+        obj._raw = slice(*args)
+
+        if key is not None:
+            _slice_cache[key] = obj
+            if len(_slice_cache) > _SLICE_CACHE_SIZE:
+                _slice_cache.popitem(last=False)
+        return obj
+
+    @classmethod
+    def from_raw(cls, s):
+        """
+        Create a Slice from a builtin `slice` object
+
+        This is equivalent to `Slice(s)`, but faster when the `start`,
+        `stop`, and `step` of `s` are all `int` or `None`, as their type
+        checking can be skipped.
+
+        >>> from ndindex import Slice
+        >>> Slice.from_raw(slice(1, 10, 2))
+        Slice(1, 10, 2)
+        >>> Slice.from_raw(slice(1, 10, 2)) == Slice(slice(1, 10, 2))
+        True
+
+        """
+        start, stop, step = s.start, s.stop, s.step
+        if ((start is None or type(start) is int)
+            and (stop is None or type(stop) is int)
+            and (step is None or type(step) is int and step != 0)):
+            if ((start is None or -_SLICE_CACHE_BOUND <= start < _SLICE_CACHE_BOUND)
+                and (stop is None or -_SLICE_CACHE_BOUND <= stop < _SLICE_CACHE_BOUND)
+                and (step is None or -_SLICE_CACHE_BOUND <= step < _SLICE_CACHE_BOUND)):
+                # Small slices go through the intern cache in __new__
+                return cls(start, stop, step)
+            obj = object.__new__(cls)
+            obj.args = (start, stop, step)
+            obj._hash = None
+            obj._raw = s
+            return obj
+        return cls(s)
+
     def _typecheck(self, start, stop=default, step=None):
-        if isinstance(start, Slice):
+        if isinstance(start, Slice): # pragma: no cover
+            # Slice(s) for a Slice s is normally handled in __new__
             return start.args
         if isinstance(start, slice):
             start, stop, step = start.start, start.stop, start.step
@@ -67,19 +183,24 @@ class Slice(NDIndex):
             raise ValueError("slice step cannot be zero")
 
         if start is not None:
-            start = operator.index(start)
+            start = operator_index(start)
         if stop is not None:
-            stop = operator.index(stop)
+            stop = operator_index(stop)
         if step is not None:
-            step = operator.index(step)
+            step = operator_index(step)
 
         args = (start, stop, step)
 
         return args
 
+    def __repr__(self):
+        # Specialized version of NDIndex.__repr__ for the three arguments
+        start, stop, step = self.args
+        return f"{self.__class__.__name__}({start}, {stop}, {step})"
+
     @property
     def raw(self):
-        return slice(*self.args)
+        return self._raw
 
     @property
     def start(self):
@@ -141,19 +262,31 @@ class Slice(NDIndex):
         1
 
         """
-        start, stop, step = self.reduce().args
-        error = ValueError("Cannot determine max length of slice")
+        # Slice is immutable, so the length only needs to be computed once.
+        try:
+            l = self._len
+        except AttributeError:
+            l = self._len = self._max_len()
+        if l is None:
+            raise ValueError("Cannot determine max length of slice")
+        return l
+
+    def _max_len(self):
+        """
+        Compute the value for `__len__`, or `None` if there is no maximum
+        """
+        start, stop, step = _reduce_no_shape(*self.args)
         # We reuse the logic in range.__len__. However, it is only correct if
-        # the slice doesn't use wrap around (see the comment in reduce()
-        # below).
+        # the slice doesn't use wrap around (see the comment in
+        # _reduce_no_shape() above).
         if start is stop is None:
-            raise error
+            return None
         if step > 0:
             # start cannot be None
             if stop is None:
                 if start >= 0:
                     # a[n:]. Extends to the end of the array.
-                    raise error
+                    return None
                 else:
                     # a[-n:]. From n from the end to the end. Same as
                     # range(-n, 0).
@@ -164,13 +297,13 @@ class Slice(NDIndex):
                 start, stop = 0, min(-start, stop)
             elif start >=0 and stop < 0:
                 # a[n:-m]. The max length depends on the size of the array.
-                raise error
+                return None
         else:
             if start is None:
                 if stop is None or stop >= 0:
                     # a[:m:-1] or a[::-1]. The max length depends on the size of
                     # the array
-                    raise error
+                    return None
                 else:
                     # a[:-m:-1]
                     start, stop = 0, -stop - 1
@@ -183,10 +316,10 @@ class Slice(NDIndex):
                     # a[-n::-1]. From n from the end to the beginning of the
                     # array backwards. The max length depends on the size of
                     # the array.
-                    raise error
+                    return None
             elif start < 0 and stop >= 0:
                 # a[-n:m:-1]. The max length depends on the size of the array
-                raise error
+                return None
             elif start >=0 and stop < 0:
                 # a[n:-m:-1] indexes from the nth element backwards to the mth
                 # element from the end.
@@ -263,31 +396,8 @@ class Slice(NDIndex):
         .ellipsis.reduce
 
         """
-        start, stop, step = self.args
-
         # Canonicalize with no shape
-
-        if step is None:
-            step = 1
-        if start is None and step > 0:
-            start = 0
-
-        if start is not None and stop is not None:
-            r = range(start, stop, step)
-            # We can reuse some of the logic built-in to range(), but we have to
-            # be careful. range() only acts like a slice if the 0 <= start <= stop (or
-            # visa-versa for negative step). Otherwise, slices are different
-            # because of wrap-around behavior. For example, range(-3, 1)
-            # represents [-3, -2, -1, 0] whereas slice(-3, 1) represents the slice
-            # of elements from the third to last to the first, which is either an
-            # empty slice or a single element slice depending on the shape of the
-            # axis.
-            if start >= 0 and stop >= 0 and len(r) == 0:
-                start, stop, step = 0, 0, 1
-            # This is not correct because a slice keeps the axis whereas an
-            # integer index removes it.
-            # if len(r) == 1:
-            #     return Integer(r[0])
+        start, stop, step = _reduce_no_shape(*self.args)
 
         if shape is None:
             return type(self)(start, stop, step)
@@ -2,7 +2,8 @@ from itertools import chain
 from functools import reduce
 from operator import mul
 
-from numpy.testing import assert_equal
+from numpy import ndarray
+from numpy.testing import assert_equal as np_assert_equal
 
 from pytest import fail
 
@@ -60,6 +61,20 @@ shapes = tuples(integers(0, 10)).filter(
              # See https://github.com/numpy/numpy/issues/15753
              lambda shape: prod([i for i in shape if i]) < 100000)
 
+def assert_equal(actual, desired):
+    """
+    Same as numpy.testing.assert_equal, but fast when the arrays are equal
+
+    numpy.testing.assert_equal has a large constant overhead, which dominates
+    the exhaustive tests. Arrays of the same shape are compared with a single
+    vectorized ==, and numpy.testing.assert_equal is only used (to produce a
+    useful error message) if that fails.
+    """
+    if (isinstance(actual, ndarray) and isinstance(desired, ndarray)
+        and actual.shape == desired.shape and (actual == desired).all()):
+        return
+    np_assert_equal(actual, desired)
+
 def check_same(a, index, func=lambda x: x, same_exception=True, assert_equal=assert_equal):
     exception = None
     try:
@@ -19,6 +19,8 @@ def test_integer_args():
     assert idx.raw == 0
     assert isinstance(idx.raw, int)
     assert Integer(zero) == zero
+    assert Integer(zero) is zero
+    assert [1, 2][zero] == 1
 
 
 def test_integer_exhaustive():
@@ -1,4 +1,6 @@
 import inspect
+import copy
+import pickle
 
 from hypothesis import given, example
 
@@ -6,6 +8,7 @@ from pytest import raises
 
 from ..ndindex import ndindex
 from ..integer import Integer
+from ..slice import Slice
 from ..ellipsis import ellipsis
 from .helpers import ndindices
 
@@ -22,6 +25,22 @@ def test_eq(idx):
     assert (idx != 'a') is True
     assert ('a' != idx) is True
 
+@given(ndindices(), ndindices())
+def test_eq_hashed(idx1, idx2):
+    # __eq__ uses the cached hashes when they are available
+    assert (idx1 == idx2) == (idx1.raw == idx2.raw)
+    hash(idx1), hash(idx2)
+    assert (idx1 == idx2) == (idx1.raw == idx2.raw)
+
+    # Copied and unpickled objects should compare the same way once their
+    # hashes are computed
+    for new in [copy.copy(idx1), copy.deepcopy(idx1),
+                pickle.loads(pickle.dumps(idx1))]:
+        assert new == idx1
+        hash(new)
+        assert new == idx1
+        assert (new == idx2) == (idx1 == idx2)
+
 @given(ndindices())
 def test_ndindex(idx):
     assert ndindex(idx) == idx
@@ -29,6 +48,27 @@ def test_ndindex(idx):
     ix = ndindex(idx)
     assert ndindex(ix.raw) == ix
 
+@given(ndindices())
+def test_copy_pickle(idx):
+    assert copy.copy(idx) == idx
+    assert copy.deepcopy(idx) == idx
+    assert pickle.loads(pickle.dumps(idx)) == idx
+
+def test_pickle_no_cached_state():
+    # The cached hash should never be pickled, since it may not be valid in
+    # another process (hash(None) is not stable across processes before
+    # Python 3.12).
+    idx = Slice(slice(None, 5, None))
+    idx._hash = 1
+    loaded = pickle.loads(pickle.dumps(idx))
+    assert hash(loaded) == hash(loaded.args)
+    assert loaded == ndindex(slice(None, 5))
+
+@given(ndindices())
+def test_slots(idx):
+    assert not hasattr(idx, '__dict__')
+    raises(AttributeError, lambda: setattr(idx, 'foo', 1))
+
 def test_ndindex_ellipsis():
     raises(TypeError, lambda: ndindex(ellipsis))
 
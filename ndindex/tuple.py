@@ -32,17 +32,20 @@ class Tuple(NDIndex):
     array([2, 3])
 
     """
-    def _typecheck(self, *args):
-        from .ellipsis import ellipsis
+    __slots__ = ()
 
+    def _typecheck(self, *args):
         newargs = []
+        n_ellipses = 0
         for arg in args:
             newarg = ndindex(arg)
             if isinstance(newarg, Tuple):
                 raise NotImplementedError("tuples of tuples are not yet supported")
+            if isinstance(newarg, ellipsis):
+                n_ellipses += 1
             newargs.append(newarg)
 
-        if newargs.count(ellipsis()) > 1:
+        if n_ellipses > 1:
             raise IndexError("an index can only have a single ellipsis ('...')")
 
         return tuple(newargs)
@@ -61,8 +64,6 @@ class Tuple(NDIndex):
         """
         Returns True if self has an ellipsis
         """
-        from .ellipsis import ellipsis
-
         return ellipsis() in self.args
 
     @property
@@ -92,8 +93,6 @@ class Tuple(NDIndex):
         2
 
         """
-        from .ellipsis import ellipsis
-
         if self.has_ellipsis:
             return self.args.index(ellipsis())
         return len(self.args)
@@ -173,7 +172,6 @@ class Tuple(NDIndex):
         .ellipsis.reduce
 
         """
-        from .ellipsis import ellipsis
         from .slice import Slice
 
         args = self.args
@@ -274,7 +272,6 @@ class Tuple(NDIndex):
         .NDIndex.expand
 
         """
-        from .ellipsis import ellipsis
         from .slice import Slice
 
         args = self.args
@@ -340,3 +337,7 @@ class Tuple(NDIndex):
         newshape = newshape + midshape + endshape[::-1]
 
         return tuple(newshape)
+
+# Imported at the bottom to avoid a circular import, since ellipsis.py
+# imports Tuple.
+from .ellipsis import ellipsis